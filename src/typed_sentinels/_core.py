@@ -9,17 +9,39 @@ from typing import (
     SupportsIndex,
     TypeGuard,
     final,
+    get_origin,
 )
 from weakref import WeakValueDictionary
 
 from ._exceptions import InvalidHintError, SubscriptedTypeError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 _OBJECT = object()
 
 
+def _hint_str(hint: Any) -> str:
+    """Return the human-readable name of `hint` used by `Sentinel.__str__`."""
+    if type(hint) is type:
+        return hint.__name__
+    hint_str, hint_repr = str(hint), repr(hint)
+    if ('[' in hint_repr) and ('.' not in hint_repr):
+        hint_str = hint_repr
+    elif hasattr(hint, '__name__'):
+        hint_str = hint.__name__
+    elif hasattr(hint, '__qualname__'):
+        hint_str = hint.__qualname__
+    if hint_str.startswith("<class '") and hint_str.endswith("'>"):  # pragma: no cover
+        hint_str = hint_str[8:-2]
+    return hint_str
+
+
+def _is_static_hint(hint: Any) -> bool:
+    """Return `True` if `hint` is a class, `Any`, or a parameterized generic, as opposed to some other value."""
+    return isinstance(hint, type) or (hint is Any) or (get_origin(hint) is not None)
+
+
 @final
 class Sentinel:
     # fmt: off
@@ -76,18 +98,19 @@ class Sentinel:
 
     # fmt: on
 
-    __slots__ = ('__weakref__', '_hint')
+    __slots__ = ('__weakref__', '_hash', '_repr', '_str', 'hint')
 
-    _cls_cache: ClassVar[WeakValueDictionary[tuple[str, Any], Sentinel[Any]]] = WeakValueDictionary()
-    _cls_hint: ClassVar[Any] = _OBJECT
+    _cls_cache: ClassVar[dict[Any, Sentinel[Any]]] = {}
     _cls_lock: ClassVar[Lock] = Lock()
+    _cls_subscripted: ClassVar[dict[Any, _SubscriptedSentinel]] = {}
+    _cls_weak_cache: ClassVar[WeakValueDictionary[Any, Sentinel[Any]]] = WeakValueDictionary()
 
-    _hint: Any
+    _hash: int
+    _repr: str
+    _str: str
 
-    @property
-    def hint(self) -> Any:
-        """Type associated with this `Sentinel` instance."""
-        return self._hint
+    hint: Any
+    """Type associated with this `Sentinel` instance."""
 
     def __new__(cls, hint: Any = _OBJECT, /) -> Any:
         """Create or retrieve a `Sentinel` instance for the given `hint` type.
@@ -101,8 +124,10 @@ class Sentinel:
         Returns
         -------
         T
-            `Sentinel` object instance for the given `hint` type, either created anew or retrievd from the class-level
-            `WeakValueDictionary` cache. The `Sentinel` instance will appear to type-checkers as an instance of `hint`.
+            `Sentinel` object instance for the given `hint` type, either created anew or retrieved from the class-level
+            cache. The `Sentinel` instance will appear to type-checkers as an instance of `hint`. Instances for types
+            are kept for the lifetime of the process; those for any other value of `hint` (e.g., a `str`) are only kept
+            for as long as they are referenced elsewhere.
 
         Raises
         ------
@@ -112,35 +137,71 @@ class Sentinel:
             If provided both a subscripted type parameter and a direct type argument and the types should differ (e.g.,
             `Sentinel[A](B)` will raise `SubscriptedTypeError`).
         """
-        if (_cls_hint := cls._cls_hint) is not _OBJECT:
-            cls._cls_hint = _OBJECT
-        if (hint is _OBJECT) and (_cls_hint is not _OBJECT):
-            hint = _cls_hint
         if hint is _OBJECT:
-            hint = Any
+            return _ANY_SENTINEL
 
-        key = (cls.__name__, hint)
-        if (inst := cls._cls_cache.get(key)) is not None:
-            return inst
+        if (hint is True) or (hint is False):  # Checked before the lookup, as `True == 1` and `False == 0`
+            raise InvalidHintError(hint)
 
-        if hint not in (_OBJECT, Any) and (_cls_hint not in (_OBJECT, Any)):
-            if (hint != _cls_hint) and (hint is not _cls_hint):
-                raise SubscriptedTypeError(hint=hint, subscripted=_cls_hint)
+        if (inst := cls._cls_cache.get(hint)) is not None:
+            return inst
+        if (inst := cls._cls_weak_cache.get(hint)) is not None:
+            return inst
 
-        if isinstance(hint, Sentinel) or (hint in (Sentinel, Ellipsis, True, False, None)):
+        if (id(hint) in _INVALID_HINT_IDS) or (type(hint) is Sentinel):
             raise InvalidHintError(hint)
 
+        inst = super().__new__(cls)
+        _SET_HASH(inst, hash((cls, hint)))
+        _SET_HINT(inst, hint)
+        _SET_REPR(inst, f'<Sentinel: {hint!r}>')
+        _SET_STR(inst, f'<Sentinel: {_hint_str(hint)}>')
+
+        # `dict.setdefault` is atomic, so concurrent misses for the same `hint` all receive whichever instance won
+        if _is_static_hint(hint):
+            return cls._cls_cache.setdefault(hint, inst)
+
+        # `WeakValueDictionary.setdefault` is not, so it must be serialized
         with cls._cls_lock:
-            if (inst := cls._cls_cache.get(key)) is None:  # pragma: no cover
-                inst = super().__new__(cls)
-                super().__setattr__(inst, '_hint', hint)
-                cls._cls_cache[key] = inst
+            return cls._cls_weak_cache.setdefault(hint, inst)
+
+    @classmethod
+    def bulk(cls, hints: Iterable[Any], /) -> list[Any]:
+        """Create or retrieve the `Sentinel` instance for each of the given `hint` types, in order.
+
+        Equivalent to `[Sentinel(hint) for hint in hints]`, but cached instances are returned without the overhead of
+        calling the class for each `hint`.
+
+        Parameters
+        ----------
+        hints : Iterable[T]
+            Types that the returned `Sentinel` instances should represent.
+
+        Returns
+        -------
+        list[T]
+            `Sentinel` object instance for each `hint` type in `hints`.
 
-        return inst
+        Raises
+        ------
+        InvalidHintError
+            If any `hint` is any of: `Sentinel`, `Ellipsis`, `True`, `False`, `None`, or a `Sentinel` instance.
+        """
+        cache = cls._cls_cache
+        insts: list[Any] = []
+        for hint in hints:
+            if (type(hint) is bool) or ((inst := cache.get(hint)) is None):
+                inst = cls(hint)
+            insts.append(inst)
+        return insts
 
     def __class_getitem__(cls, key: Any) -> Any:
-        cls._cls_hint = key
-        return cls
+        if (subscripted := cls._cls_subscripted.get(key)) is not None:
+            return subscripted
+        subscripted = _SubscriptedSentinel(key)
+        if _is_static_hint(key):
+            return cls._cls_subscripted.setdefault(key, subscripted)
+        return subscripted
 
     def __getitem__(self, key: Any) -> Any:
         return self
@@ -149,30 +210,23 @@ class Sentinel:
         return self
 
     def __str__(self) -> str:
-        hint_str, hint_repr = str(self._hint), repr(self._hint)
-        if ('[' in hint_repr) and ('.' not in hint_repr):
-            hint_str = hint_repr
-        elif hasattr(self._hint, '__name__'):
-            hint_str = self._hint.__name__
-        elif hasattr(self._hint, '__qualname__'):
-            hint_str = self._hint.__qualname__
-        if hint_str.startswith("<class '") and hint_str.endswith("'>"):  # pragma: no cover
-            hint_str = hint_str[8:-2]
-        return f'<Sentinel: {hint_str}>'
+        return self._str
 
     def __repr__(self) -> str:
-        return f'<Sentinel: {self._hint!r}>'
+        return self._repr
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self._hint))
+        return self._hash
 
     def __bool__(self) -> bool:
         return False
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__class__ == other.__class__ and self._hint == other._hint
+        if self is other:
+            return True
+        if type(other) is not Sentinel:
+            return NotImplemented
+        return (self._hash == other._hash) and (self.hint == other.hint)
 
     def __copy__(self) -> Any:
         return self
@@ -181,10 +235,10 @@ class Sentinel:
         return self
 
     def __reduce__(self) -> tuple[Callable[..., Sentinel], tuple[Any]]:
-        return (self.__class__, (self._hint,))
+        return (Sentinel, (self.hint,))
 
     def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Callable[..., Sentinel], tuple[Any]]:
-        return self.__reduce__()
+        return (Sentinel, (self.hint,))
 
     def __setattr__(self, name: str, value: Any) -> NoReturn:
         msg = f'Cannot modify attributes of {self!r}'
@@ -195,6 +249,38 @@ class Sentinel:
         raise AttributeError(msg)
 
 
+# Slot descriptor setters, used by `Sentinel.__new__` to bypass the frozen `Sentinel.__setattr__`
+_SET_HASH = Sentinel.__dict__['_hash'].__set__
+_SET_HINT = Sentinel.__dict__['hint'].__set__
+_SET_REPR = Sentinel.__dict__['_repr'].__set__
+_SET_STR = Sentinel.__dict__['_str'].__set__
+
+# `id` values of the invalid `hint` singletons other than `True` and `False` (which `Sentinel.__new__` checks earlier)
+_INVALID_HINT_IDS = frozenset(map(id, (Sentinel, Ellipsis, None)))
+
+# Returned directly by `Sentinel()`, without any lookup
+_ANY_SENTINEL = Sentinel(Any)
+
+
+@final
+class _SubscriptedSentinel:
+    """Callable returned by `Sentinel[T]`, which creates or retrieves the `Sentinel` instance for `T` when called."""
+
+    __slots__ = ('_hint',)
+
+    _hint: Any
+
+    def __init__(self, hint: Any, /) -> None:
+        self._hint = hint
+
+    def __call__(self, hint: Any = _OBJECT, /) -> Any:
+        if (hint is _OBJECT) or (hint is Any):
+            return Sentinel(self._hint if hint is _OBJECT else hint)
+        if (self._hint is not Any) and (hint is not self._hint) and (hint != self._hint):
+            raise SubscriptedTypeError(hint=hint, subscripted=self._hint)
+        return Sentinel(hint)
+
+
 def is_sentinel(obj: Any, typ: Any = None) -> TypeGuard[Sentinel]:
     """Return `True` if `obj` is a `Sentinel` instance, optionally further narrowed to be of `typ` type.
 
@@ -212,7 +298,6 @@ def is_sentinel(obj: Any, typ: Any = None) -> TypeGuard[Sentinel]:
         - `True` if `obj` is a `Sentinel` instance.
         - `False` otherwise.
     """
-    if typ is not None:
-        if isinstance(obj, Sentinel) and hasattr(obj, 'hint'):  # pragma: no cover
-            return obj.hint == typ
-    return isinstance(obj, Sentinel)
+    if type(obj) is not Sentinel:
+        return False
+    return (typ is None) or (obj.hint == typ)
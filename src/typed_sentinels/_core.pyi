@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from threading import Lock
 from types import EllipsisType
 from typing import Any, ClassVar, Literal, Never, SupportsIndex, TypeGuard, final, overload
@@ -6,17 +6,28 @@ from weakref import WeakValueDictionary
 
 @final
 class Sentinel[T: Any = Any]:
-    __slots__ = ('__weakref__', '_hint')
+    __slots__ = ('__weakref__', '_hash', '_repr', '_str', 'hint')
 
-    _cls_cache: ClassVar[WeakValueDictionary[tuple[str, Any], Sentinel[Any]]] = ...
-    _cls_hint: ClassVar[Any] = ...
+    _cls_cache: ClassVar[dict[Any, Sentinel[Any]]] = ...
     _cls_lock: ClassVar[Lock] = ...
+    _cls_subscripted: ClassVar[dict[Any, Any]] = ...
+    _cls_weak_cache: ClassVar[WeakValueDictionary[Any, Sentinel[Any]]] = ...
 
-    _hint: T
+    _hash: int
+    _repr: str
+    _str: str
 
     @property
     def hint(self) -> T: ...
 
+    # --- Batch creation -----------------------------------------------------------------------------------------------
+    @overload
+    @classmethod
+    def bulk[H](cls, hints: Iterable[type[H]], /) -> list[H]: ...
+    @overload
+    @classmethod
+    def bulk(cls, hints: Iterable[Any], /) -> list[Any]: ...
+
     # --- 'getitem' dunder methods -------------------------------------------------------------------------------------
     def __class_getitem__(cls, key: T) -> T: ...
     def __getitem__(self, key: T) -> T: ...
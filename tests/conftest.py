@@ -1,9 +1,12 @@
+import hashlib
 import json
+import os
+import re
 import subprocess
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import pytest
 
@@ -11,8 +14,11 @@ from typed_sentinels import is_sentinel
 
 from . import _objects as test_cases
 
+_CACHE_KEY = 'typed_sentinels/pyright'
+_TYPE_RE = re.compile(r'Type of "([^"]+)" is "([^"]+)"')
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExpectedType:
     """Expected type information for a variable."""
 
@@ -24,8 +30,20 @@ class ExpectedType:
 class BatchPyrightRunner:
     """Runner for batch Pyright testing over a single file."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: pytest.Cache | None = None, expected_variables: set[str] | None = None) -> None:
         self.test_cases_file = Path(__file__).parent / '_objects.py'
+        # Pyright resolves `typed_sentinels` through the `extraPaths` in `pyrightconfig.json`, i.e. from `src/`, which
+        # need not be the copy that pytest imported (e.g. with a non-editable install)
+        root = Path(__file__).parents[1]
+        self.input_files = sorted(
+            [
+                self.test_cases_file,
+                root / 'pyrightconfig.json',
+                *(root / 'src' / 'typed_sentinels').glob('*.py*'),
+            ]
+        )
+        self._cache = cache
+        self._expected_variables = expected_variables
         self._pyright_output: dict[str, Any] | None = None
         self._variable_types: dict[str, str] | None = None
 
@@ -33,24 +51,57 @@ class BatchPyrightRunner:
     def pyright_output(self) -> dict[str, Any]:
         """Cached Pyright output."""
         if self._pyright_output is None:
-            self._pyright_output = self._run_pyright()
+            self._pyright_output = self._load_or_run_pyright()
         return self._pyright_output
 
     @property
     def variable_types(self) -> dict[str, str]:
         """Cached variable types."""
         if self._variable_types is None:
-            self._variable_types = self._extract_variable_types()
+            self._variable_types = self._extract_variable_types(self._expected_variables)
         return self._variable_types
 
+    def _pyright_version(self) -> str:  # pragma: no cover
+        """Version reported by the installed Pyright, or an empty string if it cannot be run."""
+        try:
+            result = subprocess.run(
+                ['pyright', '--version'], check=False, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.SubprocessError):
+            return ''
+        return result.stdout.decode().strip()
+
+    def fingerprint(self, pyright_version: str) -> str:
+        """Hash of the Pyright version and of every file that can affect the Pyright output."""
+        digest = hashlib.sha256(pyright_version.encode())
+        for path in self.input_files:
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _load_or_run_pyright(self) -> dict[str, Any]:  # pragma: no cover
+        """Return the Pyright output saved by a previous session for the same inputs, or run Pyright and save it."""
+        if self._cache is None:
+            return self._run_pyright()
+
+        pyright_version = self._pyright_version()
+        fingerprint = self.fingerprint(pyright_version)
+        cached = cast('dict[str, Any]', self._cache.get(_CACHE_KEY, {}))  # pyright: ignore[reportUnknownMemberType]
+        if cached.get('fingerprint') == fingerprint:
+            return cached['output']
+
+        output = self._run_pyright()
+        if output:
+            self._cache.set(_CACHE_KEY, {'fingerprint': fingerprint, 'output': output, 'version': pyright_version})
+        return output
+
     def _run_pyright(self) -> dict[str, Any]:  # pragma: no cover
         """Run Pyright on the test cases file."""
         try:
             result = subprocess.run(
                 ['pyright', '--outputjson', str(self.test_cases_file)],
-                capture_output=True,
                 check=False,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
             )
 
             if result.stdout:
@@ -60,19 +111,18 @@ class BatchPyrightRunner:
         else:
             return {}
 
-    def _extract_variable_types(self) -> dict[str, str]:  # pragma: no cover
-        """Extract variable type information from Pyright output."""
+    def _extract_variable_types(self, expected: set[str] | None = None) -> dict[str, str]:  # pragma: no cover
+        """Extract variable type information from Pyright output, stopping early once all `expected` are found."""
         types: dict[str, str] = {}
 
         for diagnostic in self.pyright_output.get('generalDiagnostics', []):
-            if diagnostic.get('severity') == 'information':
-                message = diagnostic.get('message', '')
-                if 'Type of' in message and 'is' in message:
-                    parts = message.split('"')
-                    if len(parts) >= 4:
-                        var_name = parts[1]
-                        type_str = parts[3]
-                        types[var_name] = type_str
+            if diagnostic.get('severity') != 'information':
+                continue
+            if match := _TYPE_RE.match(diagnostic.get('message', '')):
+                var_name, type_str = match.groups()
+                types[var_name] = type_str
+                if (expected is not None) and expected.issubset(types):
+                    break
 
         return types
 
@@ -105,11 +155,13 @@ class BatchPyrightRunner:
 
 
 @pytest.fixture(scope='session')
-def pyright_runner() -> BatchPyrightRunner:
-    return BatchPyrightRunner()
+def pyright_runner(request: pytest.FixtureRequest) -> BatchPyrightRunner:
+    # Set `DISABLE_PYRIGHT_CACHE` to always run Pyright, e.g. if the saved output is suspected to be stale
+    cache = None if os.environ.get('DISABLE_PYRIGHT_CACHE') else getattr(request.config, 'cache', None)
+    return BatchPyrightRunner(cache, {exp.variable_name for exp in EXPECTED_TYPES})
 
 
-EXPECTED_TYPES = [
+EXPECTED_TYPES = (
     ExpectedType(
         'basic_str_sentinel',
         'str',
@@ -165,4 +217,4 @@ EXPECTED_TYPES = [
         'str | tuple[str, dict[str, str | tuple[str, ...]]]',
         is_sentinel,
     ),
-]
+)
@@ -29,6 +29,13 @@ def test_subscription() -> None:
     assert s3 is not s4
 
 
+def test_subscription_is_cached() -> None:
+    assert Sentinel[str] is Sentinel[str]
+    assert Sentinel[Callable[..., str]] is Sentinel[Callable[..., str]]
+    assert Sentinel[str] is not Sentinel[bytes]
+    assert Sentinel[str]() is Sentinel(str)
+
+
 def test_subscription_affects_hint() -> None:
     s1, s2 = Sentinel[str](), Sentinel(str)
 
@@ -53,6 +60,20 @@ def test_is_sentinel() -> None:
     assert is_sentinel(s1, bytes) is False
 
 
+def test_bulk() -> None:
+    s1, s2, s3 = Sentinel.bulk([str, bytes, str])
+
+    assert s1 is s3 is Sentinel(str)
+    assert s2 is Sentinel(bytes)
+    assert Sentinel.bulk([]) == []
+    assert Sentinel.bulk([1, 0]) == [Sentinel(1), Sentinel(0)]
+
+    with pytest.raises(InvalidHintError):
+        Sentinel.bulk([str, None])
+    with pytest.raises(InvalidHintError):
+        Sentinel.bulk([True])
+
+
 def test_singleton_behavior() -> None:
     s1, s2, s3 = Sentinel(object), Sentinel(object), Sentinel(str)
 
@@ -132,7 +153,7 @@ def test_slots() -> None:
     s = Sentinel(str)
 
     assert hasattr(s, '__slots__')
-    assert '_hint' in s.__slots__
+    assert 'hint' in s.__slots__
 
 
 def test_bool() -> None:
@@ -158,6 +179,11 @@ def test_hint_mismatch_raises() -> None:
         # (variable) _s: Any
         _s = Sentinel[str](bool)
 
+    _s = Sentinel(bytes)
+    with pytest.raises(SubscriptedTypeError):
+        # Must still raise when the mismatched `hint` is already cached
+        _s = Sentinel[str](bytes)
+
 
 def test_hint_is_sentinel_raises() -> None:
     with pytest.raises(InvalidHintError):
@@ -186,6 +212,19 @@ def test_hint_is_true_or_false_raises() -> None:
         _s = Sentinel(False)  # noqa: FBT003
 
 
+def test_hint_equal_to_true_or_false_is_valid() -> None:
+    s1, s2 = Sentinel(1), Sentinel(0)
+
+    assert s1.hint == 1
+    assert s2.hint == 0
+
+    with pytest.raises(InvalidHintError):
+        # Must still raise despite `True == 1` being cached
+        _s = Sentinel(True)  # noqa: FBT003
+    with pytest.raises(InvalidHintError):
+        _s = Sentinel(False)  # noqa: FBT003
+
+
 def test_hint_is_none_raises() -> None:
     with pytest.raises(InvalidHintError):
         # (variable) _s: Never
@@ -211,6 +250,25 @@ def test_weakref() -> None:
     assert ref() is sntl
 
 
+def test_type_hints_are_kept_alive() -> None:
+    class Dummy: ...
+
+    ref = weakref.ref(Sentinel(Dummy))
+
+    assert ref() is Sentinel(Dummy)
+
+
+def test_other_hints_are_weakly_cached() -> None:
+    sntl = Sentinel('not_a_type')
+    ref = weakref.ref(sntl)
+
+    assert Sentinel('not_a_type') is sntl
+
+    del sntl
+
+    assert ref() is None
+
+
 def test_custom_types() -> None:
     class Dummy: ...
 
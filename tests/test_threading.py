@@ -6,11 +6,20 @@
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import SimpleQueue
 from typing import Any
 
 import pytest
 
-from typed_sentinels import Sentinel
+from typed_sentinels import Sentinel, is_sentinel
+
+
+def _drain(queue: SimpleQueue[Any]) -> list[Any]:
+    """Return every item put on `queue` by the (already joined) worker threads."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get())
+    return items
 
 
 class TestSentinelThreading:
@@ -22,19 +31,18 @@ class TestSentinelThreading:
         num_threads = 50
         sentinels_per_thread = 100
 
-        all_sentinels = []
-        lock = threading.Lock()
+        barrier = threading.Barrier(num_threads)
+        results: SimpleQueue[list[Any]] = SimpleQueue()
 
         def create_sentinels() -> None:
             """Worker function that creates many sentinels."""
             local_sentinels = []
+            barrier.wait()
             for _ in range(sentinels_per_thread):
                 s = Sentinel(hint_type)
                 local_sentinels.append(s)
-                time.sleep(0.0001)
 
-            with lock:
-                all_sentinels.extend(local_sentinels)
+            results.put(local_sentinels)
 
         threads = []
         for _ in range(num_threads):
@@ -47,8 +55,10 @@ class TestSentinelThreading:
         for thread in threads:
             thread.join()
 
-        unique_ids = {id(s) for s in all_sentinels}
-        assert len(unique_ids) == 1, f'Singleton violation: found {len(unique_ids)} different objects'
+        all_sentinels = [s for local_sentinels in _drain(results) for s in local_sentinels]
+
+        first_id = id(all_sentinels[0])
+        assert all(id(s) == first_id for s in all_sentinels), 'Singleton violation: found different objects'
 
         for s in all_sentinels:
             assert s.hint == hint_type
@@ -59,21 +69,18 @@ class TestSentinelThreading:
         num_threads_per_type = 10
         sentinels_per_thread = 50
 
-        results = {}
-        results_lock = threading.Lock()
+        barrier = threading.Barrier(len(hint_types) * num_threads_per_type)
+        queue: SimpleQueue[tuple[Any, list[Any]]] = SimpleQueue()
 
         def create_sentinels_for_hint(hint_type: Any) -> None:
             """Create sentinels for a specific hint type."""
             sentinels = []
+            barrier.wait()
             for _ in range(sentinels_per_thread):
                 s = Sentinel(hint_type)
                 sentinels.append(s)
-                time.sleep(0.0001)
 
-            with results_lock:
-                if hint_type not in results:
-                    results[hint_type] = []
-                results[hint_type].extend(sentinels)
+            queue.put((hint_type, sentinels))
 
         threads = []
         for hint_type in hint_types:
@@ -87,10 +94,16 @@ class TestSentinelThreading:
         for thread in threads:
             thread.join()
 
+        results = {}
+        for hint_type, sentinels in _drain(queue):
+            if hint_type not in results:
+                results[hint_type] = []
+            results[hint_type].extend(sentinels)
+
         for hint_type, sentinels in results.items():
-            unique_ids = {id(s) for s in sentinels}
-            assert len(unique_ids) == 1, (
-                f'Singleton violation for {hint_type}: found {len(unique_ids)} different objects'
+            first_id = id(sentinels[0])
+            assert all(id(s) == first_id for s in sentinels), (
+                f'Singleton violation for {hint_type}: found different objects'
             )
 
             for s in sentinels:
@@ -100,16 +113,14 @@ class TestSentinelThreading:
         """Test for race conditions in the cache lookup and creation."""
         hint_type = int
         barrier = threading.Barrier(20)
-        created_sentinels = []
-        lock = threading.Lock()
+        results: SimpleQueue[Any] = SimpleQueue()
 
         def synchronized_creation() -> None:
             """All threads create sentinel at exactly the same time."""
             barrier.wait()
             s = Sentinel(hint_type)
 
-            with lock:
-                created_sentinels.append(s)
+            results.put(s)
 
         threads = []
         for _ in range(20):
@@ -122,27 +133,27 @@ class TestSentinelThreading:
         for thread in threads:
             thread.join()
 
-        unique_ids = {id(s) for s in created_sentinels}
-        assert len(unique_ids) == 1, f'Race condition detected: {len(unique_ids)} different objects created'
+        created_sentinels = _drain(results)
+
+        first_id = id(created_sentinels[0])
+        assert all(id(s) == first_id for s in created_sentinels), 'Race condition detected: different objects created'
 
     def test_cache_weak_reference_cleanup(self) -> None:
         """Test that cache properly handles weak reference cleanup under threading."""
-        results = []
-        results_lock = threading.Lock()
+        barrier = threading.Barrier(5)
+        queue: SimpleQueue[dict[str, Any]] = SimpleQueue()
 
         def create_and_forget_sentinels() -> None:
             """Create sentinels and let them go out of scope."""
+            barrier.wait()
             for i in range(10):
                 hint = f'unique_type_{threading.current_thread().ident}_{i}'
                 s = Sentinel(hint)
 
-                with results_lock:
-                    results.append({'thread_id': threading.current_thread().ident, 'hint': hint, 'sentinel_id': id(s)})
+                queue.put({'thread_id': threading.current_thread().ident, 'hint': hint, 'sentinel_id': id(s)})
 
                 del s
 
-                time.sleep(0.001)
-
         threads = []
         for _ in range(5):
             thread = threading.Thread(target=create_and_forget_sentinels)
@@ -154,6 +165,8 @@ class TestSentinelThreading:
         for thread in threads:
             thread.join()
 
+        results = _drain(queue)
+
         assert len(results) == 50
 
         hints_by_thread = {}
@@ -168,12 +181,13 @@ class TestSentinelThreading:
 
     def test_deadlock_prevention(self) -> None:
         """Test that the locking mechanism doesn't cause deadlocks."""
-        results = []
-        results_lock = threading.Lock()
+        barrier = threading.Barrier(15)
+        queue: SimpleQueue[list[dict[str, Any]]] = SimpleQueue()
 
         def create_multiple_sentinels() -> None:
             """Create multiple different sentinels in sequence."""
             thread_results = []
+            barrier.wait()
             for i in range(20):
                 hint_types = [str, int, float, bool, list]
                 hint = hint_types[i % len(hint_types)]
@@ -183,10 +197,7 @@ class TestSentinelThreading:
                     {'hint': hint, 'sentinel_id': id(s), 'thread_id': threading.current_thread().ident}
                 )
 
-                time.sleep(0.0005)
-
-            with results_lock:
-                results.extend(thread_results)
+            queue.put(thread_results)
 
         threads = []
         for _ in range(15):
@@ -204,6 +215,7 @@ class TestSentinelThreading:
                 pytest.fail('Potential deadlock detected - thread did not complete within timeout')
 
         end_time = time.time()
+        results = [result for thread_results in _drain(queue) for result in thread_results]
 
         assert end_time - start_time < 5.0, 'Threads took too long - possible lock contention issues'
         assert len(results) == 15 * 20, 'Not all sentinels were created'
@@ -248,17 +260,16 @@ class TestSentinelThreading:
         def worker_task(hint_type: Any, iterations: int) -> dict[str, Any]:
             """Worker that creates sentinels and returns statistics."""
             sentinels = []
-            unique_ids = set()
 
             for _ in range(iterations):
                 s = Sentinel(hint_type)
                 sentinels.append(s)
-                unique_ids.add(id(s))
 
+            first_id = id(sentinels[0])
             return {
                 'hint_type': hint_type,
                 'count': len(sentinels),
-                'unique_ids': len(unique_ids),
+                'all_same_id': all(id(s) == first_id for s in sentinels),
             }
 
         with ThreadPoolExecutor(max_workers=25) as executor:
@@ -272,13 +283,11 @@ class TestSentinelThreading:
             results = [future.result() for future in as_completed(futures)]
 
         for result in results:
-            assert result['unique_ids'] == 1, f'Task saw multiple IDs for {result["hint_type"]}: {result["unique_ids"]}'
+            assert result['all_same_id'], f'Task saw multiple IDs for {result["hint_type"]}'
 
     def test_exception_safety_under_threading(self) -> None:
         """Test that exceptions don't leave locks in inconsistent state."""
-        valid_sentinels = []
-        exceptions_caught = []
-        lock = threading.Lock()
+        queue: SimpleQueue[dict[str, list[Any]]] = SimpleQueue()
 
         def mixed_operations() -> None:
             """Mix valid and invalid sentinel creation."""
@@ -301,9 +310,7 @@ class TestSentinelThreading:
                 except Exception as e:
                     thread_results['exceptions'].append(type(e).__name__)
 
-            with lock:
-                valid_sentinels.extend(thread_results['valid'])
-                exceptions_caught.extend(thread_results['exceptions'])
+            queue.put(thread_results)
 
         threads = []
         for _ in range(10):
@@ -316,6 +323,12 @@ class TestSentinelThreading:
         for thread in threads:
             thread.join()
 
+        valid_sentinels = []
+        exceptions_caught = []
+        for thread_results in _drain(queue):
+            valid_sentinels.extend(thread_results['valid'])
+            exceptions_caught.extend(thread_results['exceptions'])
+
         assert len(valid_sentinels) > 0, 'Should have created some valid sentinels'
         assert len(exceptions_caught) > 0, 'Should have caught some exceptions'
 
@@ -408,3 +421,31 @@ class TestSentinelThreading:
         s2_id = id(s2)
 
         print(f'Weak ref cleanup test: {s1_id} -> {s2_id}, different: {s1_id != s2_id}')
+
+    def test_subscription_does_not_leak_across_threads(self) -> None:
+        """Test that `Sentinel[...]` held uncalled in one thread doesn't affect `Sentinel(...)` calls in another."""
+
+        class Unsubscribed: ...
+
+        subscribed = threading.Event()
+        resolved = threading.Event()
+        results = []
+
+        def subscribe_without_calling() -> None:
+            """Subscribe the class, then wait before calling it."""
+            subscripted = Sentinel[bytes]
+            subscribed.set()
+            resolved.wait(timeout=5.0)
+            results.append(subscripted())
+
+        thread = threading.Thread(target=subscribe_without_calling)
+        thread.start()
+        subscribed.wait(timeout=5.0)
+
+        s = Sentinel(Unsubscribed)
+        resolved.set()
+        thread.join()
+
+        assert is_sentinel(s, Unsubscribed)
+        assert results == [Sentinel(bytes)]
+        assert results[0] is Sentinel(bytes)
@@ -1,5 +1,7 @@
 """Tests for Pyright type inference integration."""
 
+from pathlib import Path
+
 import pytest
 
 from .conftest import EXPECTED_TYPES, BatchPyrightRunner, ExpectedType
@@ -44,3 +46,24 @@ class TestPyrightIntegration:
         print(f'\n✅ Found {len(found_vars)} variables with type information')
         for var, typ in sorted(variable_types.items()):
             print(f'  {var}: {typ}')
+
+    def test_fingerprint_tracks_inputs(self, tmp_path: Path) -> None:
+        runner = BatchPyrightRunner()
+        stub = tmp_path / '_core.pyi'
+        stub.write_text('class Sentinel: ...\n')
+        runner.input_files = [stub]
+
+        fingerprint = runner.fingerprint('pyright 1.0.0')
+
+        assert runner.fingerprint('pyright 1.0.0') == fingerprint
+        assert runner.fingerprint('pyright 1.0.1') != fingerprint
+
+        stub.write_text('class Sentinel:\n    hint: int\n')
+
+        assert runner.fingerprint('pyright 1.0.0') != fingerprint
+
+    def test_fingerprint_covers_analysed_sources(self, pyright_runner: BatchPyrightRunner) -> None:
+        src = Path(__file__).parents[1] / 'src' / 'typed_sentinels'
+
+        assert src / '_core.pyi' in pyright_runner.input_files
+        assert src / '_core.py' in pyright_runner.input_files